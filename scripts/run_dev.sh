@@ -1,2 +1,8 @@
 #!/bin/bash
-# Development run script
+# Development run script: Flask debug server with auto-reload (never use in production).
+# Production runs via `python -m race_ticker.app` (Uvicorn).
+
+set -e
+
+cd "$(dirname "$0")/.."
+exec flask --app "race_ticker.app:create_app()" run --debug --host "${HOST:-127.0.0.1}" --port "${PORT:-5001}"
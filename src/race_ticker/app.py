@@ -1,40 +1,206 @@
 """Flask application entry point."""
 
+import asyncio
+import atexit
+import contextlib
 import logging
+import os
+import queue
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from typing import Any
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-from flask import Flask, jsonify, render_template, request
+import orjson
+import uvicorn
+from a2wsgi import WSGIMiddleware
+from flask import Flask, Response, jsonify, render_template, request
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
 
 from .config.manager import init_config_manager, get_config_manager
 from .display.controller import init_display_controller, get_display_controller
-from .ingest.csv_fetcher import start_csv_poller, get_fetch_status, get_race_state
+from .ingest.csv_fetcher import start_csv_poller, poll_loop, get_fetch_status, get_race_state, trigger_refetch
 from .clock.clock import init_clock, get_clock
+from .timeutil import format_utc_iso
+
+_MODULE_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _MODULE_DIR.parent.parent
+_WEB_DIR = _MODULE_DIR / "web"
+_DEFAULT_CONFIG = _PROJECT_ROOT / "config" / "config.yaml"
 
 # Uptime start (set when app is created)
 _start_time: float | None = None
 
+# (unix second, ISO string) of the last /status timestamp; reused within the same second
+_last_iso_ts: tuple[int, str] = (-1, "")
+
+# Config sections that affect the display payload
+_DISPLAY_SECTIONS = ("ticker", "display", "race_time")
+
+# Short-lived response cache for polled read endpoints; mutating routes invalidate it.
+_CACHE_TIMEOUT_S = 1
+_CACHE_KEY_CLOCK = "view/api/clock"
+_CACHE_KEY_STATUS = "view/status"
+_CACHE_KEY_CONFIG = "view/api/config"
+
+# Threads serving Flask requests under Uvicorn (display, admin and /status polls overlap).
+_WSGI_WORKERS = 10
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ, formatted at most once per second."""
+    global _last_iso_ts
+    now_s = int(time.time())
+    cached = _last_iso_ts
+    if cached[0] == now_s:
+        return cached[1]
+    text = format_utc_iso(datetime.fromtimestamp(now_s, timezone.utc))
+    _last_iso_ts = (now_s, text)
+    return text
+
+
+def _body() -> dict[str, Any]:
+    """Parse the raw request body with orjson. Empty or non-object bodies yield {}.
+
+    Invalid JSON raises orjson.JSONDecodeError, which create_app maps to HTTP 400.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    data = orjson.loads(raw)
+    return data if isinstance(data, dict) else {}
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)."""
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=self._OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's bytes straight to the response; no str round-trip.
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, option=self._OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that batches writes in a 64 KB buffer.
+
+    The buffer is flushed every flush_interval_s by a daemon thread and immediately for
+    ERROR and above. File size for rollover is tracked in memory (in characters) instead of
+    seeking the stream, which would force a flush on every record.
+    """
+
+    _BUFFER_BYTES = 64 * 1024
+
+    def __init__(self, filename: Path, *, flush_interval_s: float = 30.0, **kwargs: Any) -> None:
+        self._size = 0
+        super().__init__(filename, **kwargs)
+        # Not named _closed (Handler's own flag). close() does not stop the flusher: uvicorn.run's
+        # dictConfig closes existing handlers, and emit() then reopens the stream.
+        self._stop_flush = threading.Event()
+        threading.Thread(target=self._flush_loop, args=(flush_interval_s,), daemon=True).start()
+
+    def _open(self):
+        stream = open(
+            self.baseFilename, self.mode, buffering=self._BUFFER_BYTES,
+            encoding=self.encoding, errors=self.errors,
+        )
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self, interval_s: float) -> None:
+        while not self._stop_flush.wait(interval_s):
+            self.flush()
+
+    def shutdown(self) -> None:
+        """Stop the flush thread, then flush and close the file."""
+        self._stop_flush.set()
+        self.close()
+
+
+# Set by _setup_logging: (queue handler on root, listener, file handler); see _stop_log_queue.
+_log_pipeline: tuple[QueueHandler, QueueListener, _BufferedRotatingFileHandler] | None = None
+
 
 def _setup_logging(project_root: Path) -> None:
-    """Configure logging with RotatingFileHandler (1 MB, 3 backups)."""
+    """Configure logging with a buffered rotating file handler (1 MB, 3 backups).
+
+    Records go through a QueueHandler; a QueueListener thread does the file writes and
+    rotation, so logging calls on request/poller threads never block on disk I/O.
+    """
+    global _log_pipeline
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    if root.handlers:
+        return
     log_dir = project_root / "logs"
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / "race_ticker.log"
-    handler = RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
+    handler = _BufferedRotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    queue_handler = QueueHandler(log_queue)
+    root.addHandler(queue_handler)
+    _log_pipeline = (queue_handler, listener, handler)
+    # atexit runs the last registration first: drain the queue, then flush and close the file.
+    atexit.register(handler.shutdown)
+    atexit.register(_stop_log_queue)
+
+
+def _stop_log_queue() -> None:
+    """Drain the log queue, flush the file, and log to the file handler directly from now on.
+
+    Called on ASGI lifespan shutdown as well as at exit: uvicorn re-raises SIGTERM/SIGINT
+    after shutting down, so atexit handlers do not run in that case.
+    """
+    global _log_pipeline
+    pipeline = _log_pipeline
+    if pipeline is None:
+        return
+    _log_pipeline = None
+    queue_handler, listener, handler = pipeline
+    listener.stop()
     root = logging.getLogger()
-    root.setLevel(logging.INFO)
-    if not root.handlers:
-        root.addHandler(handler)
+    root.removeHandler(queue_handler)
+    root.addHandler(handler)
+    handler.flush()
 
 
-def create_app(config_path: Path | None = None) -> Flask:
+def create_app(config_path: Path | None = None, *, start_poller: bool = True) -> Flask:
     """Create and configure Flask application.
 
     Args:
         config_path: Path to config.yaml. If None, uses default location.
+        start_poller: Start the CSV poller in a background thread. create_asgi_app passes
+            False and runs the poller on the event loop instead.
 
     Returns:
         Configured Flask app instance
@@ -42,27 +208,35 @@ def create_app(config_path: Path | None = None) -> Flask:
     global _start_time
     _start_time = time.time()
 
-    web_dir = Path(__file__).parent / "web"
     app = Flask(
         __name__,
-        template_folder=str(web_dir / "templates"),
-        static_folder=str(web_dir / "static"),
+        template_folder=str(_WEB_DIR / "templates"),
+        static_folder=str(_WEB_DIR / "static"),
         static_url_path="/static",
     )
+    app.json = OrjsonProvider(app)
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+
+    def invalidate_cached_views() -> None:
+        """Drop cached GET responses after any state change."""
+        cache.delete_many(_CACHE_KEY_CLOCK, _CACHE_KEY_STATUS, _CACHE_KEY_CONFIG)
 
     # Initialize config manager
     if config_path is None:
-        project_root = Path(__file__).parent.parent.parent
-        config_path = project_root / "config" / "config.yaml"
-    else:
-        project_root = Path(__file__).parent.parent.parent
-    _setup_logging(project_root)
+        config_path = _DEFAULT_CONFIG
+    _setup_logging(_PROJECT_ROOT)
     init_config_manager(config_path)
     init_display_controller(get_config_manager().get_config())
     init_clock(get_config_manager().get_config())
-    start_csv_poller(lambda: get_config_manager().get_config())
+    if start_poller:
+        start_csv_poller(lambda: get_config_manager().get_config())
+
+    @app.errorhandler(orjson.JSONDecodeError)
+    def invalid_json(e: orjson.JSONDecodeError):
+        return jsonify({"error": f"invalid JSON body: {e}"}), 400
 
     @app.route("/api/clock", methods=["GET"])
+    @cache.cached(timeout=_CACHE_TIMEOUT_S, key_prefix=_CACHE_KEY_CLOCK)
     def get_clock_status():
         """Current clock state and elapsed time."""
         clock = get_clock()
@@ -75,16 +249,19 @@ def create_app(config_path: Path | None = None) -> Flask:
     @app.route("/api/clock/start", methods=["GET", "POST"])
     def clock_start():
         get_clock().start()
+        invalidate_cached_views()
         return jsonify({"ok": True})
 
     @app.route("/api/clock/pause", methods=["GET", "POST"])
     def clock_pause():
         get_clock().pause()
+        invalidate_cached_views()
         return jsonify({"ok": True})
 
     @app.route("/api/clock/reset", methods=["GET", "POST"])
     def clock_reset():
         get_clock().reset()
+        invalidate_cached_views()
         return jsonify({"ok": True})
 
     @app.route("/api/payload", methods=["GET"])
@@ -111,13 +288,13 @@ def create_app(config_path: Path | None = None) -> Flask:
         return render_template("display.html")
 
     @app.route("/status", methods=["GET"])
+    @cache.cached(timeout=_CACHE_TIMEOUT_S, key_prefix=_CACHE_KEY_STATUS)
     def status():
         """Health/status JSON including CSV fetch state, clock, and first n runners (n = max_runners)."""
         uptime_s = time.time() - _start_time if _start_time else 0
         clock = get_clock()
-        fetch = get_fetch_status()
         out = {
-            "current_time_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "current_time_utc": _utc_now_iso(),
             "uptime_seconds": round(uptime_s, 2),
             "config_loaded": True,
             "clock": {
@@ -125,8 +302,8 @@ def create_app(config_path: Path | None = None) -> Flask:
                 "elapsed_seconds": round(clock.get_elapsed_seconds(), 2),
                 "elapsed_display": clock.get_elapsed_display(),
             },
-            **fetch,
         }
+        out.update(get_fetch_status())
         # Include first max_runners lines of current CSV (runner) data for admin preview
         race_state = get_race_state()
         max_runners = int(
@@ -148,6 +325,7 @@ def create_app(config_path: Path | None = None) -> Flask:
         return jsonify(out)
 
     @app.route("/api/config", methods=["GET"])
+    @cache.cached(timeout=_CACHE_TIMEOUT_S, key_prefix=_CACHE_KEY_CONFIG)
     def get_config():
         """Return current configuration."""
         manager = get_config_manager()
@@ -156,52 +334,110 @@ def create_app(config_path: Path | None = None) -> Flask:
     @app.route("/api/config", methods=["POST"])
     def patch_config():
         """Patch config (JSON body), validate and persist YAML."""
-        patch = request.get_json(silent=True) or {}
-        get_config_manager().update_config(patch)
-        if any(k in patch for k in ("ticker", "display", "race_time")):
-            get_display_controller().refresh_active_from_config(
-                get_config_manager().get_config()
-            )
-        return jsonify(get_config_manager().get_config())
+        patch = _body()
+        manager = get_config_manager()
+        # Snapshots are never mutated, so the pre-patch sections stay intact for comparison.
+        before = {k: manager.get_config().get(k) for k in _DISPLAY_SECTIONS}
+        manager.update_config(patch)
+        invalidate_cached_views()
+        if "races" in patch or "csv" in patch:
+            trigger_refetch()
+        config = manager.get_config()
+        if any(config.get(k) != before[k] for k in _DISPLAY_SECTIONS):
+            get_display_controller().refresh_active_from_config(config)
+        return jsonify(config)
 
     @app.route("/api/race/select", methods=["POST"])
     def race_select():
         """Set active race profile. Body: { \"race_id\": \"race_half\" }."""
-        data = request.get_json(silent=True) or {}
+        data = _body()
         race_id = data.get("race_id")
         if not race_id or not isinstance(race_id, str):
             return jsonify({"error": "race_id required (string)"}), 400
+        if get_config_manager().get_config()["races"].get("active_race_id") == race_id:
+            return jsonify({"ok": True, "noop": True})
         get_config_manager().update_config({"races": {"active_race_id": race_id}})
+        invalidate_cached_views()
+        trigger_refetch()
+        return jsonify({"ok": True})
+
+    @app.route("/api/refresh", methods=["POST"])
+    def refresh():
+        """Fetch the active race CSV now instead of at the next poll interval."""
+        trigger_refetch()
         return jsonify({"ok": True})
 
     @app.route("/api/mode", methods=["POST"])
     def mode_set():
         """Set mode. Body: { \"source\": \"live\"|\"simulate\" }."""
-        data = request.get_json(silent=True) or {}
+        data = _body()
         source = data.get("source")
         if source not in ("live", "simulate"):
             return jsonify({"error": "source must be 'live' or 'simulate'"}), 400
+        if get_config_manager().get_config()["mode"].get("source") == source:
+            return jsonify({"ok": True, "noop": True})
         get_config_manager().update_config({"mode": {"source": source}})
+        invalidate_cached_views()
         return jsonify({"ok": True})
 
     @app.route("/api/freeze", methods=["POST"])
     def freeze_set():
         """Set freeze display updates. Body: { \"freeze\": true|false }."""
-        data = request.get_json(silent=True) or {}
+        data = _body()
         freeze = data.get("freeze")
         if not isinstance(freeze, bool):
             return jsonify({"error": "freeze must be boolean"}), 400
+        if get_config_manager().get_config()["mode"].get("freeze_updates") is freeze:
+            return jsonify({"ok": True, "noop": True})
         get_config_manager().update_config({"mode": {"freeze_updates": freeze}})
+        invalidate_cached_views()
         return jsonify({"ok": True})
 
     return app
 
 
+def create_asgi_app(config_path: Path | None = None):
+    """Create the ASGI application served by Uvicorn.
+
+    HTTP requests go to the Flask app through a2wsgi's WSGIMiddleware, which runs each request
+    on a thread pool (_WSGI_WORKERS threads), so overlapping polls are served concurrently.
+    The CSV poller runs as an asyncio task started on lifespan startup and cancelled on shutdown.
+    """
+    wsgi_app = WSGIMiddleware(create_app(config_path, start_poller=False), workers=_WSGI_WORKERS)
+
+    async def app(scope, receive, send):
+        if scope["type"] != "lifespan":
+            await wsgi_app(scope, receive, send)
+            return
+        poller: asyncio.Task | None = None
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                poller = asyncio.create_task(poll_loop(lambda: get_config_manager().get_config()))
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if poller is not None:
+                    poller.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await poller
+                _stop_log_queue()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    return app
+
+
 if __name__ == "__main__":
-    app = create_app()
+    # Production entry point: serve the WSGI app through Uvicorn; requests run on a thread
+    # pool, so overlapping polls from the display/admin pages are handled concurrently. One
+    # worker process only: clock, display payload and CSV poller live in process memory.
+    # For Flask's debug server (auto-reload, debugger; development only) use scripts/run_dev.sh.
+    asgi_app = create_asgi_app()
     cfg = get_config_manager().get_config()
-    app.run(
+    uvicorn.run(
+        asgi_app,
         host=cfg["app"]["host"],
         port=cfg["app"]["port"],
-        debug=True,
+        workers=1,
+        lifespan="on",
     )
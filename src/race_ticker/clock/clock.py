@@ -1,9 +1,12 @@
 """Internal race timer state management. Persists to config on change."""
 
 import threading
+import time
 from datetime import datetime, timezone
 from typing import Any, Literal
 
+from ..timeutil import format_utc_iso
+
 ClockState = Literal["running", "paused", "stopped"]
 
 _lock = threading.Lock()
@@ -32,70 +35,88 @@ def format_elapsed(seconds: float) -> str:
 
 
 class RaceClock:
-    """Race timer: running / paused / stopped. State persisted to YAML via config manager."""
+    """Race timer: running / paused / stopped. State persisted to YAML via config manager.
+
+    Clock state is held in one immutable tuple (state, started_monotonic, accumulated_s) that
+    writers replace under _lock with a single attribute store; readers take no lock.
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         clock = config.get("clock", {})
-        self._state: ClockState = clock.get("state") or "stopped"
-        if self._state not in ("running", "paused", "stopped"):
-            self._state = "stopped"
+        state: ClockState = clock.get("state") or "stopped"
+        if state not in ("running", "paused", "stopped"):
+            state = "stopped"
         self._started_at_utc: str | None = clock.get("started_at_utc")
-        self._accumulated_s: float = float(clock.get("accumulated_s") or 0)
-        if self._accumulated_s < 0:
-            self._accumulated_s = 0
+        accumulated_s = float(clock.get("accumulated_s") or 0)
+        if accumulated_s < 0:
+            accumulated_s = 0
+        # Elapsed time is measured on the monotonic clock; started_at_utc is only kept for
+        # persistence and mapped onto the monotonic clock once here.
+        started_monotonic: float | None = None
+        if state == "running":
+            started = _parse_utc(self._started_at_utc)
+            if started:
+                running_s = (datetime.now(timezone.utc) - started).total_seconds()
+                started_monotonic = time.monotonic() - running_s
+        self._snap: tuple[ClockState, float | None, float] = (state, started_monotonic, accumulated_s)
+        # (whole seconds, formatted text) of the last get_elapsed_display() result
+        self._display_cache: tuple[int, str] = (-1, "")
 
     def get_state(self) -> ClockState:
-        with _lock:
-            return self._state
+        return self._snap[0]
 
     def get_elapsed_seconds(self) -> float:
-        with _lock:
-            if self._state == "running" and self._started_at_utc:
-                started = _parse_utc(self._started_at_utc)
-                if started:
-                    delta = (datetime.now(timezone.utc) - started).total_seconds()
-                    return self._accumulated_s + delta
-            return self._accumulated_s
+        state, started_monotonic, accumulated_s = self._snap
+        if state == "running" and started_monotonic is not None:
+            return accumulated_s + (time.monotonic() - started_monotonic)
+        return accumulated_s
 
     def get_elapsed_display(self) -> str:
-        return format_elapsed(self.get_elapsed_seconds())
+        s = int(round(self.get_elapsed_seconds()))
+        cached_s, cached_text = self._display_cache
+        if s == cached_s:
+            return cached_text
+        text = format_elapsed(s)
+        self._display_cache = (s, text)
+        return text
 
     def _persist(self) -> None:
         from ..config.manager import get_config_manager
+        state, _, accumulated_s = self._snap
         get_config_manager().update_config({
             "clock": {
-                "state": self._state,
+                "state": state,
                 "started_at_utc": self._started_at_utc,
-                "accumulated_s": self._accumulated_s,
+                "accumulated_s": accumulated_s,
             }
         })
 
     def start(self) -> None:
         with _lock:
-            if self._state == "running":
+            state, _, accumulated_s = self._snap
+            if state == "running":
                 return
-            if self._state == "paused" or self._state == "stopped":
-                self._accumulated_s = self._accumulated_s  # no change
-            self._state = "running"
-            self._started_at_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            self._started_at_utc = format_utc_iso()
+            self._snap = ("running", time.monotonic(), accumulated_s)
             self._persist()
 
     def pause(self) -> None:
         with _lock:
-            if self._state != "running":
+            state, started_monotonic, accumulated_s = self._snap
+            if state != "running":
                 return
-            started = _parse_utc(self._started_at_utc)
-            if started:
-                self._accumulated_s += (datetime.now(timezone.utc) - started).total_seconds()
-            self._state = "paused"
+            if started_monotonic is not None:
+                accumulated_s += time.monotonic() - started_monotonic
             self._started_at_utc = None
+            self._snap = ("paused", None, accumulated_s)
             self._persist()
 
     def reset(self) -> None:
         with _lock:
-            self._state = "stopped"
+            if self._snap == ("stopped", None, 0):
+                return
             self._started_at_utc = None
-            self._accumulated_s = 0
+            self._snap = ("stopped", None, 0)
             self._persist()
 
 
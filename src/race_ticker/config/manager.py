@@ -1,26 +1,57 @@
 """YAML configuration loader and persister."""
 
+import atexit
+import logging
 import os
 import shutil
+import threading
+import orjson
 import yaml
 from pathlib import Path
 from typing import Any, Dict
 
-from .schema import validate_config, validate_patch
+from .schema import validate_config, validate_patch, validate_sections
+
+# Prefer libyaml's C implementation; fall back to pure Python if PyYAML was built without it.
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+# Changes are written to disk this long after the first unsaved change, so bursts of
+# patches (admin edits, clock start/pause/reset) share a single YAML dump.
+FLUSH_DELAY_S = 1.0
+
+
+def _copy_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-copy a config tree via an orjson round-trip (config holds only JSON-compatible values)."""
+    return orjson.loads(orjson.dumps(config, option=orjson.OPT_NON_STR_KEYS))
 
 
 class ConfigManager:
-    """Manages YAML configuration with atomic writes."""
+    """Manages YAML configuration with debounced atomic writes."""
     
-    def __init__(self, config_path: Path):
+    def __init__(self, config_path: Path, flush_delay_s: float = FLUSH_DELAY_S):
         """Initialize config manager.
         
         Args:
             config_path: Path to config.yaml file
+            flush_delay_s: Seconds between a change and writing it to disk
         """
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        # Read-only snapshot handed out by get_config(); rebuilt on every change.
+        self._snapshot: Dict[str, Any] = {}
+        self._flush_delay_s = flush_delay_s
+        # Serializes update_config (copy, merge, validate, publish) between request threads.
+        self._update_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._dirty = False
         self._load()
+        atexit.register(self.flush)
     
     def _load(self) -> None:
         """Load configuration from YAML file."""
@@ -28,22 +59,26 @@ class ConfigManager:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            self._config = yaml.safe_load(f) or {}
+            self._config = yaml.load(f, Loader=_YamlLoader) or {}
         
         validate_config(self._config)
+        self._snapshot = _copy_config(self._config)
     
     def get_config(self) -> Dict[str, Any]:
         """Get current configuration.
         
         Returns:
-            Copy of current configuration dictionary
+            Shared snapshot of current configuration dictionary. Callers must not
+            mutate it; use get_mutable_copy() if a private copy is needed.
         """
-        # Return a deep copy to prevent external modification
-        import copy
-        return copy.deepcopy(self._config)
+        return self._snapshot
+    
+    def get_mutable_copy(self) -> Dict[str, Any]:
+        """Get a private deep copy of current configuration that callers may modify."""
+        return _copy_config(self._snapshot)
     
     def update_config(self, patch: Dict[str, Any]) -> None:
-        """Update configuration with a patch and persist to disk.
+        """Update configuration with a patch and schedule a write to disk.
         
         Args:
             patch: Dictionary with nested keys to update (e.g., {"mode": {"source": "simulate"}})
@@ -53,31 +88,62 @@ class ConfigManager:
         """
         validate_patch(patch)
         
-        # Apply patch recursively
-        self._apply_patch(self._config, patch)
-        
-        # Validate full config after patch
-        validate_config(self._config)
-        
-        # Atomic write: write to temp file, then rename
-        self._atomic_write()
+        with self._update_lock:
+            # Apply patch (deep merge) to a copy, so a rejected patch leaves the config untouched
+            config = _copy_config(self._config)
+            self._apply_patch(config, patch)
+            
+            # Validate the sections touched by the patch (the rest was validated before)
+            validate_sections(config, patch.keys())
+            # The merged copy is never mutated again, so it doubles as the published snapshot
+            self._config = config
+            self._snapshot = config
+        self._schedule_flush()
+    
+    def flush(self) -> None:
+        """Write pending changes to disk now. No-op if nothing changed since the last write."""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                self._atomic_write(self._snapshot)
+            except Exception:
+                self._dirty = True
+                logger.exception("Failed to write config to %s", self.config_path)
+    
+    def _schedule_flush(self) -> None:
+        """Mark config dirty and start the flush timer unless one is already pending."""
+        with self._flush_lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_delay_s, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
     
     def _apply_patch(self, target: Dict[str, Any], patch: Dict[str, Any]) -> None:
-        """Recursively apply patch to target dictionary."""
-        for key, value in patch.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._apply_patch(target[key], value)
-            else:
-                target[key] = value
+        """Deep-merge patch into target dictionary (iteratively, nested dicts are merged)."""
+        stack = [(target, patch)]
+        while stack:
+            t, p = stack.pop()
+            for key, value in p.items():
+                current = t.get(key)
+                if type(current) is dict and type(value) is dict:
+                    stack.append((current, value))
+                else:
+                    t[key] = value
     
-    def _atomic_write(self) -> None:
+    def _atomic_write(self, config: Dict[str, Any]) -> None:
         """Write config to disk atomically using temp file + rename."""
         temp_path = self.config_path.with_suffix('.yaml.tmp')
         
         try:
             # Write to temp file
             with open(temp_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self._config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
             
             # Atomic rename (works on POSIX systems)
             temp_path.replace(self.config_path)
@@ -1,10 +1,13 @@
 """Configuration schema and validation."""
 
 import re
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Tuple
 
 # Valid template tags
-VALID_TEMPLATE_TAGS = {"runner", "lap", "lap_time", "distance"}
+VALID_TEMPLATE_TAGS = frozenset({"runner", "lap", "lap_time", "distance"})
+
+# Matches {tag} or {tag:format}; group 1 is the tag name
+_TAG_RE = re.compile(r"\{([^}:]+)(?::[^}]*)?\}")
 
 
 def _validate_template(template: str | None) -> None:
@@ -26,8 +29,7 @@ def _validate_template(template: str | None) -> None:
         raise ValueError("display.template cannot be empty")
     
     # Find all {tag} or {tag:format} patterns
-    tag_pattern = re.compile(r"\{([^}:]+)(?::[^}]*)?\}")
-    matches = tag_pattern.findall(template)
+    matches = _TAG_RE.findall(template)
     
     # Check for unmatched braces
     open_braces = template.count("{")
@@ -49,73 +51,117 @@ def _validate_template(template: str | None) -> None:
         )
 
 
+_MISSING = object()
+
+
+def _is_str(v: Any) -> bool:
+    return isinstance(v, str)
+
+
+def _is_bool(v: Any) -> bool:
+    return isinstance(v, bool)
+
+
+def _is_present(v: Any) -> bool:
+    return v is not _MISSING
+
+
+def _is_positive_int(v: Any) -> bool:
+    return isinstance(v, int) and v >= 1
+
+
+def _is_positive_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and v > 0
+
+
+def _is_non_negative_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and v >= 0
+
+
+def _is_optional_non_negative_whole(v: Any) -> bool:
+    # Integral floats (3.0 from YAML or the admin form) are accepted; bool is not a count.
+    if v is _MISSING:
+        return True
+    return (
+        isinstance(v, (int, float)) and not isinstance(v, bool) and v >= 0 and float(v).is_integer()
+    )
+
+
+# Section -> ((key, check, error message), ...). Sections are validated in this order;
+# a missing key is passed to the check as _MISSING.
+_SCHEMA: Dict[str, Tuple[Tuple[str, Callable[[Any], bool], str], ...]] = {
+    "app": (
+        ("host", _is_str, "app.host must be a string"),
+        ("port", _is_positive_int, "app.port must be a positive integer"),
+    ),
+    "mode": (
+        ("source", lambda v: v in ("live", "simulate"), "mode.source must be 'live' or 'simulate'"),
+        ("freeze_updates", _is_bool, "mode.freeze_updates must be a boolean"),
+    ),
+    "races": (
+        ("active_race_id", _is_str, "races.active_race_id must be a string"),
+        ("profiles", _is_present, "Missing 'races.profiles' section"),
+    ),
+    "csv": (
+        ("poll_interval_s", _is_positive_number, "csv.poll_interval_s must be a positive number"),
+        ("timeout_s", _is_positive_number, "csv.timeout_s must be a positive number"),
+    ),
+    "display": (
+        ("max_runners", _is_positive_int, "display.max_runners must be a positive integer"),
+    ),
+    "ticker": (
+        ("font_size_px", _is_positive_int, "ticker.font_size_px must be a positive integer"),
+        ("speed_px_s", _is_positive_number, "ticker.speed_px_s must be a positive number"),
+        ("fps", _is_positive_int, "ticker.fps must be a positive integer"),
+    ),
+    "race_time": (
+        ("enabled", _is_bool, "race_time.enabled must be a boolean"),
+        (
+            "insert_every_loops",
+            _is_optional_non_negative_whole,
+            "race_time.insert_every_loops must be a non-negative whole number",
+        ),
+    ),
+    "clock": (
+        (
+            "state",
+            lambda v: v in ("running", "paused", "stopped"),
+            "clock.state must be 'running', 'paused', or 'stopped'",
+        ),
+        ("accumulated_s", _is_non_negative_number, "clock.accumulated_s must be a non-negative number"),
+    ),
+}
+
+
+def _validate_section(config: Dict[str, Any], name: str) -> None:
+    """Validate one top-level section against _SCHEMA. Raises ValueError on failure."""
+    section = config.get(name, _MISSING)
+    if section is _MISSING:
+        raise ValueError(f"Missing '{name}' section")
+    for key, check, message in _SCHEMA[name]:
+        if not check(section.get(key, _MISSING)):
+            raise ValueError(message)
+    if name == "display":
+        _validate_template(section.get("template"))
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """Validate configuration structure and values.
     
     Raises ValueError if validation fails.
     """
-    # App section
-    if "app" not in config:
-        raise ValueError("Missing 'app' section")
-    if not isinstance(config["app"].get("host"), str):
-        raise ValueError("app.host must be a string")
-    if not isinstance(config["app"].get("port"), int) or config["app"].get("port") < 1:
-        raise ValueError("app.port must be a positive integer")
-    
-    # Mode section
-    if "mode" not in config:
-        raise ValueError("Missing 'mode' section")
-    if config["mode"].get("source") not in ("live", "simulate"):
-        raise ValueError("mode.source must be 'live' or 'simulate'")
-    if not isinstance(config["mode"].get("freeze_updates"), bool):
-        raise ValueError("mode.freeze_updates must be a boolean")
-    
-    # Races section
-    if "races" not in config:
-        raise ValueError("Missing 'races' section")
-    if not isinstance(config["races"].get("active_race_id"), str):
-        raise ValueError("races.active_race_id must be a string")
-    if "profiles" not in config["races"]:
-        raise ValueError("Missing 'races.profiles' section")
-    
-    # CSV section
-    if "csv" not in config:
-        raise ValueError("Missing 'csv' section")
-    if not isinstance(config["csv"].get("poll_interval_s"), (int, float)) or config["csv"].get("poll_interval_s") <= 0:
-        raise ValueError("csv.poll_interval_s must be a positive number")
-    if not isinstance(config["csv"].get("timeout_s"), (int, float)) or config["csv"].get("timeout_s") <= 0:
-        raise ValueError("csv.timeout_s must be a positive number")
-    
-    # Display section
-    if "display" not in config:
-        raise ValueError("Missing 'display' section")
-    if not isinstance(config["display"].get("max_runners"), int) or config["display"].get("max_runners") < 1:
-        raise ValueError("display.max_runners must be a positive integer")
-    _validate_template(config["display"].get("template"))
-    
-    # Ticker section
-    if "ticker" not in config:
-        raise ValueError("Missing 'ticker' section")
-    if not isinstance(config["ticker"].get("font_size_px"), int) or config["ticker"].get("font_size_px") < 1:
-        raise ValueError("ticker.font_size_px must be a positive integer")
-    if not isinstance(config["ticker"].get("speed_px_s"), (int, float)) or config["ticker"].get("speed_px_s") <= 0:
-        raise ValueError("ticker.speed_px_s must be a positive number")
-    if not isinstance(config["ticker"].get("fps"), int) or config["ticker"].get("fps") < 1:
-        raise ValueError("ticker.fps must be a positive integer")
-    
-    # Race time section
-    if "race_time" not in config:
-        raise ValueError("Missing 'race_time' section")
-    if not isinstance(config["race_time"].get("enabled"), bool):
-        raise ValueError("race_time.enabled must be a boolean")
+    for name in _SCHEMA:
+        _validate_section(config, name)
+
+
+def validate_sections(config: Dict[str, Any], sections: Iterable[str]) -> None:
+    """Validate only the given top-level sections of config (e.g. those touched by a patch).
     
-    # Clock section
-    if "clock" not in config:
-        raise ValueError("Missing 'clock' section")
-    if config["clock"].get("state") not in ("running", "paused", "stopped"):
-        raise ValueError("clock.state must be 'running', 'paused', or 'stopped'")
-    if not isinstance(config["clock"].get("accumulated_s"), (int, float)) or config["clock"].get("accumulated_s") < 0:
-        raise ValueError("clock.accumulated_s must be a non-negative number")
+    Unknown section names are ignored. Raises ValueError if validation fails.
+    """
+    for name in sections:
+        if name in _SCHEMA:
+            _validate_section(config, name)
 
 
 def validate_patch(patch: Dict[str, Any]) -> None:
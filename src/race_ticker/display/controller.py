@@ -1,10 +1,25 @@
 """Server-side display payload management with double-buffering."""
 
+import itertools
 import threading
-from datetime import datetime, timezone
 from typing import Any
 
-_lock = threading.Lock()
+from ..clock.clock import get_clock
+from ..timeutil import format_utc_iso
+from ..ingest.csv_fetcher import get_race_state
+
+# Bound on first use by _ticker_text_builder(): the formatter imports this module, so it
+# cannot be imported at load time.
+_build_queued_ticker_text = None
+
+
+def _ticker_text_builder():
+    """Return formatter.build_queued_ticker_text, importing it once."""
+    global _build_queued_ticker_text
+    if _build_queued_ticker_text is None:
+        from ..format.formatter import build_queued_ticker_text
+        _build_queued_ticker_text = build_queued_ticker_text
+    return _build_queued_ticker_text
 
 
 def _y_px_from_ticker(ticker: dict[str, Any]) -> int:
@@ -19,63 +34,91 @@ def _y_px_from_ticker(ticker: dict[str, Any]) -> int:
         return 0
 
 
-def build_default_payload(config: dict[str, Any]) -> dict[str, Any]:
-    """Build a default display payload from config (shown until CSV data is loaded)."""
+# Last (config, style, scroll, show_race_time_every_loops) built by _style_from_config. Config
+# snapshots are immutable, so identity is the cache key; holding the reference keeps it valid.
+_style_cache: tuple[dict[str, Any], dict[str, Any], dict[str, Any], int] | None = None
+
+
+def _style_from_config(config: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any], int]:
+    """Return (style, scroll, show_race_time_every_loops) payload fields for config.
+
+    Memoized per config object; the returned dicts are shared between payloads and must not
+    be mutated.
+    """
+    global _style_cache
+    cached = _style_cache
+    if cached is not None and cached[0] is config:
+        return cached[1], cached[2], cached[3]
     ticker = config.get("ticker", {})
     display = config.get("display", {})
     race_time = config.get("race_time", {})
     enabled = race_time.get("enabled", True)
-    show_every_loops = race_time.get("insert_every_loops", 3) if enabled else 0
+    # Validated as a whole number, but YAML and the admin form may supply it as a float (3.0)
+    show_every_loops = int(race_time.get("insert_every_loops", 3)) if enabled else 0
+    style = {
+        "background_color": display.get("background_color", "#000000"),
+        "font_family": ticker.get("font_family", "monospace"),
+        "font_size_px": ticker.get("font_size_px", 64),
+        "letter_spacing_px": ticker.get("letter_spacing_px", 1),
+        "text_color": display.get("text_color", "#ff9900"),
+        "y_px": _y_px_from_ticker(ticker),
+    }
+    scroll = {
+        "speed_px_s": ticker.get("speed_px_s", 180),
+        "fps": ticker.get("fps", 30),
+    }
+    _style_cache = (config, style, scroll, show_every_loops)
+    return style, scroll, show_every_loops
+
+
+def build_default_payload(config: dict[str, Any]) -> dict[str, Any]:
+    """Build a default display payload from config (shown until CSV data is loaded)."""
+    style, scroll, show_every_loops = _style_from_config(config)
     return {
         "version": 1,
-        "generated_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "generated_at_utc": format_utc_iso(),
         "ticker_text": "Loading Data",
         "race_time_text": "RACE TIME: 0:00:00",
         "show_race_time_every_loops": show_every_loops,
-        "style": {
-            "background_color": display.get("background_color", "#000000"),
-            "font_family": ticker.get("font_family", "monospace"),
-            "font_size_px": ticker.get("font_size_px", 64),
-            "letter_spacing_px": ticker.get("letter_spacing_px", 1),
-            "text_color": display.get("text_color", "#ff9900"),
-            "y_px": _y_px_from_ticker(ticker),
-        },
-        "scroll": {
-            "speed_px_s": ticker.get("speed_px_s", 180),
-            "fps": ticker.get("fps", 30),
-        },
+        "style": style,
+        "scroll": scroll,
     }
 
 
 class DisplayController:
-    """Holds active (and later pending) payload; swaps on loop complete."""
+    """Holds active (and later pending) payload; swaps on loop complete.
+
+    Read-copy-update: published payload dicts are immutable and readers take no lock. Writers
+    build a new dict off-lock and publish it with a single reference store; _writer_lock only
+    orders writers (CSV updates, config refreshes, loop-complete swaps) against each other.
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._active_payload = build_default_payload(config)
         self._pending_payload: dict[str, Any] | None = None
-        self._next_version = 2  # 1 used by default payload
+        self._version_counter = itertools.count(2)  # 1 used by default payload
+        self._writer_lock = threading.Lock()
 
     def get_active_payload(self) -> dict[str, Any]:
-        """Return current active payload (copy)."""
-        import copy
-        with _lock:
-            return copy.deepcopy(self._active_payload)
+        """Return current active payload (shared; callers must not mutate it).
+
+        Payloads are never modified after being published: a new dict is built and swapped in
+        with a single reference store, so the reference read here is always consistent.
+        """
+        return self._active_payload
 
     def get_next_version(self) -> int:
-        """Return and increment version for new payloads (thread-safe)."""
-        with _lock:
-            v = self._next_version
-            self._next_version += 1
-            return v
+        """Return and increment version for new payloads (thread-safe: count.__next__ is atomic)."""
+        return next(self._version_counter)
 
     def set_pending_payload(self, payload: dict[str, Any] | None) -> None:
         """Set pending payload; will become active on next loop complete."""
-        with _lock:
+        with self._writer_lock:
             self._pending_payload = payload
 
     def set_active_payload(self, payload: dict[str, Any]) -> None:
         """Set payload as active immediately (e.g. when CSV data updates). Clears pending."""
-        with _lock:
+        with self._writer_lock:
             self._active_payload = payload
             self._pending_payload = None
 
@@ -94,42 +137,23 @@ class DisplayController:
     def _apply_config_to_payload(
         self, config: dict[str, Any], *, set_pending: bool
     ) -> None:
-        import copy
-        ticker = config.get("ticker", {})
-        display = config.get("display", {})
-        race_time = config.get("race_time", {})
-        with _lock:
-            current = copy.deepcopy(self._active_payload)
-            v = self._next_version
-            self._next_version += 1
-        current["version"] = v
-        current["generated_at_utc"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        enabled = race_time.get("enabled", True)
-        current["show_race_time_every_loops"] = race_time.get("insert_every_loops", 3) if enabled else 0
-        current["style"] = {
-            "background_color": display.get("background_color", "#000000"),
-            "font_family": ticker.get("font_family", "monospace"),
-            "font_size_px": ticker.get("font_size_px", 64),
-            "letter_spacing_px": ticker.get("letter_spacing_px", 1),
-            "text_color": display.get("text_color", "#ff9900"),
-            "y_px": _y_px_from_ticker(ticker),
-        }
-        current["scroll"] = {
-            "speed_px_s": ticker.get("speed_px_s", 180),
-            "fps": ticker.get("fps", 30),
-        }
+        # Shallow copy: every key changed below is reassigned wholesale.
+        current = dict(self._active_payload)
+        current["version"] = self.get_next_version()
+        current["generated_at_utc"] = format_utc_iso()
+        style, scroll, show_every_loops = _style_from_config(config)
+        current["show_race_time_every_loops"] = show_every_loops
+        current["style"] = style
+        current["scroll"] = scroll
         try:
-            from ..ingest.csv_fetcher import get_race_state
-            from ..format.formatter import build_queued_ticker_text
-            from ..clock.clock import get_clock
             rs = get_race_state()
             if rs is not None:
                 race_time_str = get_clock().get_elapsed_display()
-                current["ticker_text"] = build_queued_ticker_text(rs, config, race_time_str=race_time_str)
+                current["ticker_text"] = _ticker_text_builder()(rs, config, race_time_str=race_time_str)
                 current["race_time_text"] = "RACE TIME: " + race_time_str
         except Exception:
             pass
-        with _lock:
+        with self._writer_lock:
             if set_pending:
                 self._pending_payload = current
             else:
@@ -138,7 +162,7 @@ class DisplayController:
 
     def swap_pending_to_active(self) -> bool:
         """If pending exists, make it active. Returns True if swapped."""
-        with _lock:
+        with self._writer_lock:
             if self._pending_payload is None:
                 return False
             self._active_payload = self._pending_payload
@@ -1,10 +1,60 @@
 """Converts RaceState to display strings and full payload."""
 
-from datetime import datetime, timezone
-from typing import Any
+import functools
+import string
+import threading
+from typing import Any, Callable
 
-from ..ingest.parser import RaceState
-from ..display.controller import _y_px_from_ticker
+from ..timeutil import format_utc_iso
+from ..ingest.parser import RaceState, RunnerState
+from ..display.controller import _style_from_config
+
+# Template tag -> expression on the runner `r`. Only these expressions are ever emitted as code.
+_TEMPLATE_FIELDS = {
+    "runner": "r.runner_number",
+    "lap": "r.lap_number",
+    "lap_time": "r.lap_time_str",
+    "distance": '(r.distance_str or "")',
+}
+
+
+def _format_with_str_format(template: str) -> Callable[[RunnerState], str]:
+    return lambda r: template.format(
+        runner=r.runner_number,
+        lap=r.lap_number,
+        lap_time=r.lap_time_str,
+        distance=r.distance_str or "",
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_template(template: str) -> Callable[[RunnerState], str]:
+    """Compile a display template into a per-runner format function.
+    Same output as template.format(runner=..., lap=..., lap_time=..., distance=...), but the
+    template is parsed once into an f-string. Literal text and format specs are passed as data,
+    never as code. Templates outside the known tags fall back to str.format.
+    """
+    try:
+        pieces = list(string.Formatter().parse(template))
+    except ValueError:
+        return _format_with_str_format(template)
+    src: list[str] = []
+    specs: dict[str, str] = {}
+    for literal, field, spec, conversion in pieces:
+        src.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        expr = _TEMPLATE_FIELDS.get(field)
+        if expr is None or "{" in (spec or "") or conversion not in (None, "r", "s", "a"):
+            return _format_with_str_format(template)
+        conv = f"!{conversion}" if conversion else ""
+        if spec:
+            name = f"_spec{len(specs)}"
+            specs[name] = spec
+            src.append(f"{{{expr}{conv}:{{{name}}}}}")
+        else:
+            src.append(f"{{{expr}{conv}}}")
+    return eval("lambda r: f" + repr("".join(src)), {"__builtins__": {}, **specs})
 
 
 def format_ticker_text(race_state: RaceState, config: dict[str, Any]) -> str:
@@ -17,16 +67,73 @@ def format_ticker_text(race_state: RaceState, config: dict[str, Any]) -> str:
     separator = display.get("separator", " // ")
     max_runners = int(display.get("max_runners", 10))
     runners = race_state.runners[:max_runners]
-    parts = []
-    for r in runners:
-        part = template.format(
-            runner=r.runner_number,
-            lap=r.lap_number,
-            lap_time=r.lap_time_str,
-            distance=r.distance_str or "",
-        )
-        parts.append(part)
-    return separator.join(parts)
+    fmt = _compile_template(template)
+    return separator.join([fmt(r) for r in runners])
+
+
+# Racer segments keyed by (id(race_state), template, separator, max_runners). Values keep the
+# RaceState alive so its id cannot be reused while cached. Oldest entry is evicted first.
+_SEGMENT_CACHE_SIZE = 4
+_segment_cache: dict[tuple[int, str, str, int], tuple[RaceState, str]] = {}
+_segment_lock = threading.Lock()
+
+
+def _racer_segment(race_state: RaceState, config: dict[str, Any]) -> str:
+    """Return format_ticker_text(race_state, config) + separator, memoized per RaceState.
+
+    A RaceState is only replaced when the CSV content changes, so the segment is reused
+    across clock ticks and config refreshes that don't touch the display template.
+    """
+    display = config.get("display", {})
+    key = (
+        id(race_state),
+        display.get("template", "NR.{runner:02d} LAP {lap} TIME {lap_time}"),
+        display.get("separator", " // "),
+        int(display.get("max_runners", 10)),
+    )
+    hit = _segment_cache.get(key)
+    if hit is not None:
+        return hit[1]
+    segment = format_ticker_text(race_state, config) + key[2]
+    with _segment_lock:
+        if len(_segment_cache) >= _SEGMENT_CACHE_SIZE:
+            del _segment_cache[next(iter(_segment_cache))]
+        _segment_cache[key] = (race_state, segment)
+    return segment
+
+
+# Racer blocks per queued ticker string (see build_queued_ticker_text).
+_REPEAT_COUNT = 50
+
+
+# Last (racer_segment, race_time_segment, show_every_loops, repeat_count, text) built by
+# _queue_segments. Racer segments are memoized per RaceState, so the same segment object plus
+# an unchanged race time (several rebuilds within one clock second) gives the same text.
+_queue_cache: tuple[str, str, int, int, str] | None = None
+
+
+def _queue_segments(
+    racer_segment: str, race_time_segment: str, show_every_loops: int, repeat_count: int
+) -> str:
+    """Repeat racer_segment repeat_count times, inserting race_time_segment after every N."""
+    global _queue_cache
+    cached = _queue_cache
+    if (
+        cached is not None
+        and cached[0] is racer_segment
+        and cached[1] == race_time_segment
+        and cached[2] == show_every_loops
+        and cached[3] == repeat_count
+    ):
+        return cached[4]
+    if show_every_loops <= 0:
+        text = racer_segment * repeat_count
+    else:
+        block = racer_segment * show_every_loops + race_time_segment
+        full_blocks, rem = divmod(repeat_count, show_every_loops)
+        text = block * full_blocks + racer_segment * rem
+    _queue_cache = (racer_segment, race_time_segment, show_every_loops, repeat_count, text)
+    return text
 
 
 def build_queued_ticker_text(
@@ -34,27 +141,60 @@ def build_queued_ticker_text(
     config: dict[str, Any],
     *,
     race_time_str: str = "0:00:00",
-    repeat_count: int = 50,
+    repeat_count: int = _REPEAT_COUNT,
 ) -> str:
     """Build one long ticker string as a queue of segments: each segment ends with separator.
     Repeats racer block; every insert_every_loops blocks inserts a race time segment.
     So the next segment always appears right behind the previous (no blank screen).
     """
-    display = config.get("display", {})
-    separator = display.get("separator", " // ")
-    race_time_config = config.get("race_time", {})
-    enabled = race_time_config.get("enabled", True)
-    show_every_loops = race_time_config.get("insert_every_loops", 3) if enabled else 0
+    separator = config.get("display", {}).get("separator", " // ")
+    _, _, show_every_loops = _style_from_config(config)
+    return _queue_segments(
+        _racer_segment(race_state, config),
+        f"RACE TIME: {race_time_str}{separator}",
+        show_every_loops,
+        repeat_count,
+    )
+
 
-    racer_segment = format_ticker_text(race_state, config) + separator
-    race_time_segment = f"RACE TIME: {race_time_str}{separator}"
+# Last (config, builder) from make_payload_builder. Config snapshots are immutable, so identity
+# is the cache key; holding the reference keeps it valid.
+_builder_cache: tuple[dict[str, Any], Callable[[RaceState, int, str], dict[str, Any]]] | None = None
 
-    segments: list[str] = []
-    for i in range(repeat_count):
-        segments.append(racer_segment)
-        if show_every_loops > 0 and (i + 1) % show_every_loops == 0:
-            segments.append(race_time_segment)
-    return "".join(segments)
+
+def make_payload_builder(config: dict[str, Any]) -> Callable[[RaceState, int, str], dict[str, Any]]:
+    """Return build(race_state, version, race_time_str) -> payload, specialized for config.
+
+    Style, scroll, race time interval and separator are read from config once; the builder
+    only fills in version, generated_at_utc, ticker_text and race_time_text. Memoized per
+    config object, so a config change yields a new builder.
+    """
+    global _builder_cache
+    cached = _builder_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    style, scroll, show_every_loops = _style_from_config(config)
+    separator = config.get("display", {}).get("separator", " // ")
+
+    def build(race_state: RaceState, version: int, race_time_str: str) -> dict[str, Any]:
+        ticker_text = _queue_segments(
+            _racer_segment(race_state, config),
+            f"RACE TIME: {race_time_str}{separator}",
+            show_every_loops,
+            _REPEAT_COUNT,
+        )
+        return {
+            "version": version,
+            "generated_at_utc": format_utc_iso(),
+            "ticker_text": ticker_text,
+            "race_time_text": f"RACE TIME: {race_time_str}",
+            "show_race_time_every_loops": show_every_loops,
+            "style": style,
+            "scroll": scroll,
+        }
+
+    _builder_cache = (config, build)
+    return build
 
 
 def build_payload(
@@ -68,31 +208,4 @@ def build_payload(
     Ticker text is a long queue of segments (racer + race time every N), each ending with separator,
     so the display scrolls continuously with no blank gap between segments.
     """
-    ticker = config.get("ticker", {})
-    display = config.get("display", {})
-    race_time_config = config.get("race_time", {})
-    now_utc = datetime.now(timezone.utc)
-    ticker_text = build_queued_ticker_text(
-        race_state, config, race_time_str=race_time_str
-    )
-    enabled = race_time_config.get("enabled", True)
-    show_every_loops = race_time_config.get("insert_every_loops", 3) if enabled else 0
-    return {
-        "version": version,
-        "generated_at_utc": now_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "ticker_text": ticker_text,
-        "race_time_text": f"RACE TIME: {race_time_str}",
-        "show_race_time_every_loops": show_every_loops,
-        "style": {
-            "background_color": display.get("background_color", "#000000"),
-            "font_family": ticker.get("font_family", "monospace"),
-            "font_size_px": ticker.get("font_size_px", 64),
-            "letter_spacing_px": ticker.get("letter_spacing_px", 1),
-            "text_color": display.get("text_color", "#ff9900"),
-            "y_px": _y_px_from_ticker(ticker),
-        },
-        "scroll": {
-            "speed_px_s": ticker.get("speed_px_s", 180),
-            "fps": ticker.get("fps", 30),
-        },
-    }
+    return make_payload_builder(config)(race_state, version, race_time_str)
@@ -1,4 +1,4 @@
 """Data ingestion module."""
 
 from .parser import RaceState, RunnerState
-from .csv_fetcher import get_race_state, get_fetch_status, start_csv_poller
+from .csv_fetcher import get_race_state, get_fetch_status, poll_loop, start_csv_poller, trigger_refetch
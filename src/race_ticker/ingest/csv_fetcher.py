@@ -1,28 +1,84 @@
-"""CSV fetching and polling thread."""
+"""CSV fetching and polling (asyncio task or background thread)."""
 
-import hashlib
+import asyncio
+import contextlib
 import logging
+import queue
 import threading
-import time
-from datetime import datetime, timezone
+import zlib
+from dataclasses import dataclass
 from typing import Callable
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
+import urllib3
+
+from ..clock.clock import get_clock
+from ..timeutil import format_utc_iso
 from .parser import parse_csv, RaceState
 
-# Late import to avoid circular import at module load (display/format not yet ready)
+# Latest-wins hand-off from the poller to the payload rebuild worker (size 1: a rebuild that
+# has not started yet is replaced by the newer one).
+_rebuild_q: "queue.Queue[tuple[RaceState, dict]]" = queue.Queue(maxsize=1)
+_rebuild_worker_lock = threading.Lock()
+_rebuild_worker_started = False
+
+
 def _build_and_set_pending(race_state: RaceState, config: dict) -> None:
-    from ..format.formatter import build_payload
+    """Queue a display payload rebuild for race_state; returns immediately."""
+    try:
+        _rebuild_q.get_nowait()
+    except queue.Empty:
+        pass
+    _rebuild_q.put_nowait((race_state, config))
+
+
+def _run_rebuild_worker() -> None:
+    """Background loop: build payloads handed over by the poller and publish them."""
+    while True:
+        race_state, config = _rebuild_q.get()
+        try:
+            _rebuild_payload(race_state, config)
+        except Exception:
+            logger.exception("Display payload rebuild failed")
+
+
+def _start_rebuild_worker() -> None:
+    """Start the payload rebuild thread once."""
+    global _rebuild_worker_started
+    with _rebuild_worker_lock:
+        if _rebuild_worker_started:
+            return
+        threading.Thread(target=_run_rebuild_worker, daemon=True).start()
+        _rebuild_worker_started = True
+
+
+# Bound on first rebuild by _resolve(): display and format import this package, so they
+# cannot be imported at module load.
+_make_payload_builder_fn = None
+_get_display_controller_fn = None
+
+
+def _resolve() -> None:
+    """Import the display/format entry points used by _rebuild_payload (once)."""
+    global _make_payload_builder_fn, _get_display_controller_fn
+    from ..format.formatter import make_payload_builder
     from ..display.controller import get_display_controller
-    from ..clock.clock import get_clock
+    _make_payload_builder_fn = make_payload_builder
+    _get_display_controller_fn = get_display_controller
+
+
+def _rebuild_payload(race_state: RaceState, config: dict) -> None:
     if config.get("mode", {}).get("freeze_updates"):
         return
-    version = get_display_controller().get_next_version()
+    if _make_payload_builder_fn is None:
+        _resolve()
+    controller = _get_display_controller_fn()
+    version = controller.get_next_version()
     race_time_str = get_clock().get_elapsed_display()
-    payload = build_payload(race_state, config, version=version, race_time_str=race_time_str)
+    payload = _make_payload_builder_fn(config)(race_state, version, race_time_str)
     # Set active immediately so display sees new queued ticker on next poll (no blank gap).
-    get_display_controller().set_active_payload(payload)
+    controller.set_active_payload(payload)
 
 
 logger = logging.getLogger(__name__)
@@ -39,28 +95,42 @@ _fetch_status = {
 _status_lock = threading.Lock()
 
 
-def get_fetch_status() -> dict:
-    """Return a copy of current fetch status for /status endpoint."""
-    with _status_lock:
-        out = {
-            "last_fetch_time": _fetch_status["last_fetch_time"],
-            "last_hash": _fetch_status["last_hash"],
-            "hash_changed": _fetch_status["hash_changed"],
-            "last_error": _fetch_status["last_error"],
-            "last_successful_parse_time": _fetch_status["last_successful_parse_time"],
+def _build_status() -> dict:
+    """Build the public status dict from _fetch_status. Call with _status_lock held."""
+    out = {
+        "last_fetch_time": _fetch_status["last_fetch_time"],
+        "last_hash": _fetch_status["last_hash"],
+        "hash_changed": _fetch_status["hash_changed"],
+        "last_error": _fetch_status["last_error"],
+        "last_successful_parse_time": _fetch_status["last_successful_parse_time"],
+    }
+    rs = _fetch_status["race_state"]
+    if rs is not None:
+        out["race_state_summary"] = {
+            "runner_count": len(rs.runners),
+            "updated_at_utc": format_utc_iso(rs.updated_at_utc),
+            "source": rs.source,
         }
-        rs = _fetch_status["race_state"]
-        if rs is not None:
-            out["race_state_summary"] = {
-                "runner_count": len(rs.runners),
-                "updated_at_utc": rs.updated_at_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "source": rs.source,
-            }
-            out["using_last_known_good"] = _fetch_status["last_error"] is not None
-        else:
-            out["race_state_summary"] = None
-            out["using_last_known_good"] = False
-        return out
+        out["using_last_known_good"] = _fetch_status["last_error"] is not None
+    else:
+        out["race_state_summary"] = None
+        out["using_last_known_good"] = False
+    return out
+
+
+def _publish_status() -> None:
+    """Rebuild the published status after changing _fetch_status. Call with _status_lock held."""
+    global _last_status
+    _last_status = _build_status()
+
+
+# Status as last published by the poller; replaced wholesale, never mutated.
+_last_status = _build_status()
+
+
+def get_fetch_status() -> dict:
+    """Return current fetch status for /status endpoint (shared; do not mutate)."""
+    return _last_status
 
 
 def get_race_state() -> RaceState | None:
@@ -69,83 +139,191 @@ def get_race_state() -> RaceState | None:
         return _fetch_status["race_state"]
 
 
-def _fetch_bytes(url: str, timeout_s: float) -> bytes:
-    """Download URL and return raw bytes. Raises on error."""
-    req = Request(url, headers={"User-Agent": "RaceTicker/1.0"})
-    with urlopen(req, timeout=timeout_s) as resp:
-        if resp.status != 200:
-            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
-        return resp.read()
+@dataclass(slots=True)
+class _PollState:
+    """Poller state carried between iterations."""
+    previous_hash: str | None = None
+    # HTTP validators from the last 200 response, valid only for this URL.
+    url: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+# Shared pools: the connection to the CSV host (or proxy) is kept alive across polls, so HTTPS
+# feeds pay for one TLS handshake instead of one per poll. No retries (the next poll is the
+# retry), but redirects are followed as urlopen did.
+_RETRIES = urllib3.Retry(total=None, connect=0, read=0, other=0, redirect=5)
+_http = urllib3.PoolManager(maxsize=1, retries=_RETRIES)
+# Proxy URL -> ProxyManager, created on first use.
+_proxy_pools: dict[str, urllib3.ProxyManager] = {}
+
+
+def _pool_for(url: str) -> urllib3.PoolManager:
+    """Return the pool to fetch url with, honouring *_proxy / no_proxy the way urlopen does."""
+    parts = urlsplit(url)
+    proxy = getproxies().get(parts.scheme)
+    if not proxy or proxy_bypass(parts.netloc.rpartition("@")[2]):
+        return _http
+    pool = _proxy_pools.get(proxy)
+    if pool is None:
+        proxy_url = proxy if "://" in proxy else f"http://{proxy}"
+        auth = urllib3.util.parse_url(proxy_url).auth
+        proxy_headers = urllib3.make_headers(proxy_basic_auth=unquote(auth)) if auth else None
+        pool = urllib3.ProxyManager(
+            proxy_url, proxy_headers=proxy_headers, maxsize=1, retries=_RETRIES
+        )
+        _proxy_pools[proxy] = pool
+    return pool
+
+
+def _fetch_bytes(
+    url: str, timeout_s: float, etag: str | None = None, last_modified: str | None = None
+) -> tuple[bytes | None, str | None, str | None]:
+    """Download URL, conditionally if validators are given. Raises on error.
+
+    Returns (body, etag, last_modified); body is None when the server answers 304 Not Modified.
+    """
+    headers = {"User-Agent": "RaceTicker/1.0"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    resp = _pool_for(url).request("GET", url, headers=headers, timeout=timeout_s)
+    if resp.status == 304:
+        return None, etag, last_modified
+    if resp.status != 200:
+        raise urllib3.exceptions.HTTPError(f"HTTP Error {resp.status}: {resp.reason}")
+    return resp.data, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+
+def _poll_once(get_config: Callable[[], dict], state: _PollState) -> float:
+    """One poller iteration: fetch CSV URL, compute checksum, parse on change, update status.
+
+    Updates state in place; returns seconds to wait before the next iteration.
+    """
+    poll_interval_s = 10.0
+    # Status fields changed this iteration; published in a single critical section at the end.
+    updates: dict = {}
+    # One timestamp per iteration, shared by the success and fetch-error paths.
+    fetch_time_str = format_utc_iso()
+    try:
+        config = get_config()
+        races = config.get("races", {})
+        profiles = races.get("profiles", {})
+        active_id = races.get("active_race_id")
+        if not active_id or active_id not in profiles:
+            return 10.0
+        csv_config = config.get("csv", {})
+        url = profiles[active_id].get("csv_url")
+        if not url:
+            return 10.0
+        poll_interval_s = float(csv_config.get("poll_interval_s", 10))
+        timeout_s = float(csv_config.get("timeout_s", 5))
+
+        if url != state.url:
+            state.url, state.etag, state.last_modified = url, None, None
+        # Only the poller writes race_state, so reading it here needs no lock.
+        have_state = _fetch_status["race_state"] is not None
+        # Until a parse has succeeded, fetch unconditionally: a 304 would leave nothing to parse.
+        if have_state:
+            data, etag, last_modified = _fetch_bytes(url, timeout_s, state.etag, state.last_modified)
+        else:
+            data, etag, last_modified = _fetch_bytes(url, timeout_s)
+        state.etag, state.last_modified = etag, last_modified
+
+        if data is None:
+            # 304 Not Modified: same body as last time, nothing to hash or parse.
+            current_hash = state.previous_hash
+            hash_changed = False
+            should_parse = False
+        else:
+            # Change detection only (no adversary): CRC32 is far cheaper than a cryptographic hash.
+            current_hash = f"{zlib.crc32(data):08x}"
+            hash_changed = state.previous_hash is not None and current_hash != state.previous_hash
+            state.previous_hash = current_hash
+            should_parse = hash_changed or not have_state
+
+        if should_parse:
+            try:
+                race_state = parse_csv(data, config)
+                updates["race_state"] = race_state
+                updates["last_successful_parse_time"] = format_utc_iso(race_state.updated_at_utc)
+                updates["last_error"] = None
+                _build_and_set_pending(race_state, config)
+            except ValueError as e:
+                logger.warning("CSV parse failed: %s", e)
+                updates["last_error"] = str(e)
+
+        updates["last_fetch_time"] = fetch_time_str
+        updates["last_hash"] = current_hash
+        updates["hash_changed"] = hash_changed
+    except (urllib3.exceptions.HTTPError, OSError) as e:
+        err_msg = str(e)
+        logger.warning("CSV fetch failed: %s", err_msg)
+        # leave last_hash and hash_changed as-is
+        updates["last_fetch_time"] = fetch_time_str
+        updates["last_error"] = err_msg
+    except Exception as e:
+        logger.exception("CSV fetcher error: %s", e)
+        updates["last_error"] = str(e)
+
+    if updates:
+        with _status_lock:
+            _fetch_status.update(updates)
+            _publish_status()
+
+    return poll_interval_s
+
+
+# Cut short the wait between polls (see trigger_refetch). The thread poller waits on _wake;
+# a running poll_loop registers its event loop and asyncio.Event in _async_wake.
+_wake = threading.Event()
+_async_wake: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
+
+
+def trigger_refetch() -> None:
+    """Poll the CSV now instead of waiting out the poll interval (e.g. after a config change)."""
+    _wake.set()
+    async_wake = _async_wake
+    if async_wake is not None:
+        loop, event = async_wake
+        with contextlib.suppress(RuntimeError):  # loop already closed
+            loop.call_soon_threadsafe(event.set)
 
 
 def _run_poller(get_config: Callable[[], dict]) -> None:
-    """Background loop: fetch CSV URL, compute hash, update status."""
-    previous_hash = None
+    """Background thread loop around _poll_once."""
+    state = _PollState()
     while True:
-        try:
-            config = get_config()
-            races = config.get("races", {})
-            profiles = races.get("profiles", {})
-            active_id = races.get("active_race_id")
-            if not active_id or active_id not in profiles:
-                time.sleep(10)
-                continue
-            csv_config = config.get("csv", {})
-            url = profiles[active_id].get("csv_url")
-            if not url:
-                time.sleep(10)
-                continue
-            poll_interval_s = float(csv_config.get("poll_interval_s", 10))
-            timeout_s = float(csv_config.get("timeout_s", 5))
-
-            now_utc = datetime.now(timezone.utc)
-            fetch_time_str = now_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            data = _fetch_bytes(url, timeout_s)
-            current_hash = hashlib.sha256(data).hexdigest()
-            hash_changed = previous_hash is not None and current_hash != previous_hash
-            previous_hash = current_hash
-
-            with _status_lock:
-                _race_state = _fetch_status["race_state"]
-            should_parse = hash_changed or _race_state is None
-
-            if should_parse:
-                try:
-                    race_state = parse_csv(data, config)
-                    parse_time_str = race_state.updated_at_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-                    with _status_lock:
-                        _fetch_status["race_state"] = race_state
-                        _fetch_status["last_successful_parse_time"] = parse_time_str
-                        _fetch_status["last_error"] = None
-                    _build_and_set_pending(race_state, config)
-                except ValueError as e:
-                    logger.warning("CSV parse failed: %s", e)
-                    with _status_lock:
-                        _fetch_status["last_error"] = str(e)
-
-            with _status_lock:
-                _fetch_status["last_fetch_time"] = fetch_time_str
-                _fetch_status["last_hash"] = current_hash
-                _fetch_status["hash_changed"] = hash_changed
-        except (URLError, HTTPError, OSError) as e:
-            err_msg = str(e)
-            logger.warning("CSV fetch failed: %s", err_msg)
-            now_utc = datetime.now(timezone.utc)
-            fetch_time_str = now_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-            with _status_lock:
-                _fetch_status["last_fetch_time"] = fetch_time_str
-                _fetch_status["last_error"] = err_msg
-                # leave last_hash and hash_changed as-is
-        except Exception as e:
-            logger.exception("CSV fetcher error: %s", e)
-            with _status_lock:
-                _fetch_status["last_error"] = str(e)
-
-        time.sleep(poll_interval_s)
+        wait_s = _poll_once(get_config, state)
+        _wake.wait(wait_s)
+        _wake.clear()
+
+
+async def poll_loop(get_config: Callable[[], dict]) -> None:
+    """Asyncio poller: run as a task on the server's event loop (cancel it to stop).
+
+    The blocking fetch/parse runs via asyncio.to_thread; waiting between polls is an
+    asyncio.Event wait, so no thread is parked for the poll interval and trigger_refetch
+    can end it early.
+    """
+    global _async_wake
+    _start_rebuild_worker()
+    wake = asyncio.Event()
+    _async_wake = (asyncio.get_running_loop(), wake)
+    state = _PollState()
+    try:
+        while True:
+            wait_s = await asyncio.to_thread(_poll_once, get_config, state)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), wait_s)
+            wake.clear()
+    finally:
+        _async_wake = None
 
 
 def start_csv_poller(get_config: Callable[[], dict]) -> None:
-    """Start the CSV polling background thread. Safe to call once."""
+    """Start the CSV polling background thread (for WSGI servers without an event loop). Safe to call once."""
+    _start_rebuild_worker()
     t = threading.Thread(target=_run_poller, args=(get_config,), daemon=True)
     t.start()
@@ -1,13 +1,16 @@
 """CSV parsing and validation into canonical RaceState."""
 
 import csv
+import heapq
 import io
+import itertools
+import operator
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Iterator, Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunnerState:
     """Single runner state from CSV."""
     runner_number: int
@@ -16,11 +19,11 @@ class RunnerState:
     distance_str: str | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RaceState:
     """Canonical race state (max 10 runners)."""
     updated_at_utc: datetime
-    runners: list[RunnerState]
+    runners: tuple[RunnerState, ...]
     distance_label: str | None
     source: Literal["live", "simulate"]
 
@@ -32,6 +35,15 @@ COL_LAP_TIME = 2
 COL_DISTANCE = 3
 
 
+def _csv_rows(csv_bytes: bytes) -> Iterator[list[str]]:
+    """Yield CSV rows, decoding UTF-8 as the reader streams (no full decoded copy of the body)."""
+    reader = csv.reader(io.TextIOWrapper(io.BytesIO(csv_bytes), encoding="utf-8", newline=""))
+    try:
+        yield from reader
+    except UnicodeDecodeError as e:
+        raise ValueError(f"CSV decode failed: {e}") from e
+
+
 def parse_csv(csv_bytes: bytes, config: dict) -> RaceState:
     """Parse CSV bytes into RaceState. Raises ValueError on validation failure.
 
@@ -45,39 +57,33 @@ def parse_csv(csv_bytes: bytes, config: dict) -> RaceState:
     if sort_runners not in ("runner", "csv_order"):
         sort_runners = "runner"
 
-    try:
-        text = csv_bytes.decode("utf-8")
-    except UnicodeDecodeError as e:
-        raise ValueError(f"CSV decode failed: {e}") from e
-
-    reader = csv.reader(io.StringIO(text))
+    # Insertion-ordered: keys stay in order of first appearance even when a later row updates them
     by_runner: dict[int, tuple[int, str, str | None]] = {}
-    csv_order: list[int] = []  # runner numbers in order of first appearance
 
-    for i, row in enumerate(reader):
+    for i, row in enumerate(_csv_rows(csv_bytes)):
         if len(row) < 3:
             raise ValueError(f"Row {i + 1}: need at least 3 columns (runner, lap, lap_time)")
+        # int() ignores surrounding whitespace and csv.reader yields str: no strip()/str() needed
         try:
-            rn = int(row[COL_RUNNER].strip())
-            ln = int(row[COL_LAP].strip())
-            lt = str(row[COL_LAP_TIME]).strip()
-            dist = (row[COL_DISTANCE].strip()) if len(row) > COL_DISTANCE else ""
-            dist = dist or None
-        except (ValueError, TypeError) as e:
+            rn = int(row[COL_RUNNER])
+            ln = int(row[COL_LAP])
+        except ValueError as e:
             raise ValueError(f"Row {i + 1}: invalid or missing field: {e}") from e
+        lt = row[COL_LAP_TIME].strip()
+        dist = row[COL_DISTANCE].strip() or None if len(row) > COL_DISTANCE else None
         if not lt:
             raise ValueError(f"Row {i + 1}: lap_time is empty")
-        if rn not in by_runner or ln >= by_runner[rn][0]:
+        prev = by_runner.get(rn)
+        if prev is None or ln >= prev[0]:
             by_runner[rn] = (ln, lt, dist)
-        if rn not in csv_order:
-            csv_order.append(rn)
 
     if sort_runners == "csv_order":
-        ordered = [(rn, by_runner[rn]) for rn in csv_order if rn in by_runner][:max_runners]
+        ordered = list(itertools.islice(by_runner.items(), max_runners))
     else:
-        ordered = sorted(by_runner.items(), key=lambda x: x[0])[:max_runners]
+        # Only the lowest max_runners numbers are kept: a bounded heap beats a full sort.
+        ordered = heapq.nsmallest(max_runners, by_runner.items(), key=operator.itemgetter(0))
 
-    runners = [
+    runners = tuple(
         RunnerState(
             runner_number=rn,
             lap_number=lap_number,
@@ -85,7 +91,7 @@ def parse_csv(csv_bytes: bytes, config: dict) -> RaceState:
             distance_str=dist,
         )
         for rn, (lap_number, lap_time_str, dist) in ordered
-    ]
+    )
 
     return RaceState(
         updated_at_utc=datetime.now(timezone.utc),
@@ -0,0 +1,21 @@
+"""UTC timestamp formatting shared by the API, display payloads, CSV status and the clock."""
+
+import time
+from datetime import datetime
+
+
+def format_utc_iso(dt: datetime | None = None) -> str:
+    """Format a UTC datetime (default: now) as YYYY-MM-DDTHH:MM:SSZ.
+
+    Builds the string from integer fields directly, which is cheaper than strftime.
+    """
+    if dt is None:
+        t = time.gmtime()
+        return (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+        )
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )